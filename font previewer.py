@@ -1,18 +1,30 @@
 import sys
 import os
+import re
+import math
+import json
+import hashlib
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from functools import partial
+from collections import OrderedDict
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QScrollArea, QLabel,
-    QPushButton, QLineEdit, QFileDialog, QProgressDialog, QSpinBox,
-    QHBoxLayout, QMenu, QToolButton, QFrame, QMessageBox
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QListView, QLabel,
+    QPushButton, QLineEdit, QFileDialog, QSpinBox,
+    QHBoxLayout, QMenu, QToolButton, QMessageBox, QStyledItemDelegate, QStyle,
+    QCheckBox
+)
+from PySide6.QtGui import (
+    QFont, QFontDatabase, QFontMetrics, QAction, QIcon, QColor, QPalette,
+    QTextLayout, QTextOption, QImage, QPainter, QRawFont
+)
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal, QSize, QAbstractListModel, QModelIndex, QStandardPaths,
+    QByteArray, QFile, QIODevice, QTimer, QPointF, QRectF
 )
-from PySide6.QtGui import QFont, QFontDatabase, QAction, QIcon
-from PySide6.QtCore import Qt, QThread, Signal, QSize
 from PySide6.QtWidgets import QScroller
 
 # Set up logging
@@ -26,6 +38,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hebrew and Arabic blocks, including their presentation forms
+_RTL_RE = re.compile(r"[\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\uFB1D-\uFDFF\uFE70-\uFEFF]")
+
+FONT_EXTENSIONS = frozenset({"ttf", "otf", "ttc", "fon", "woff", "woff2"})
+
 @dataclass
 class FontPreviewConfig:
     """Configuration settings for font preview"""
@@ -33,143 +50,441 @@ class FontPreviewConfig:
     default_size: int = 24
     min_size: int = 6
     max_size: int = 96
-    chunk_size: int = 10
+    refresh_delay_ms: int = 200
+    read_batch_size: int = 16
+    hide_unsupported_fonts: bool = False
     window_size: tuple = (800, 600)
 
-class ThreadBase(QThread):
-    """Base class for all worker threads"""
+def _families_cache_path() -> Path:
+    """Get the path of the on-disk cache of system font families"""
+    location = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation
+    )
+    return Path(location) / "families.v1.json"
+
+def _font_dirs_signature() -> str:
+    """Hash the modification times of the system font directories"""
+    digest = hashlib.blake2b()
+    for font_dir in QStandardPaths.standardLocations(
+        QStandardPaths.StandardLocation.FontsLocation
+    ):
+        # Fonts are often installed into subdirectories, whose changes
+        # do not touch the mtime of the top-level directory
+        for root, _, _ in os.walk(font_dir):
+            try:
+                mtime = os.stat(root).st_mtime_ns
+            except OSError:
+                continue
+            digest.update(f"{root}:{mtime}\n".encode())
+    return digest.hexdigest()
+
+def _load_cached_families() -> Optional[Tuple[str, List[str]]]:
+    """Return the signature and font families stored in the cache"""
+    try:
+        with open(_families_cache_path(), encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        return cache["sig"], cache["families"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_cached_families(signature: str, families: List[str]):
+    """Atomically write the font families cache to disk"""
+    cache_path = _families_cache_path()
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump({"sig": signature, "families": families}, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write font families cache: {e}")
+
+class WorkerSignals(QObject):
+    """Signals emitted by pool workers, which cannot emit signals themselves"""
+    finished = Signal(list)
+    error = Signal(str)
+    families_refreshed = Signal(str, list)
+    font_data_ready = Signal(list)
+    fonts_checked = Signal(list, dict)
+    preview_rendered = Signal(object, QImage, QRectF)
+    done = Signal(object)
+
+class WorkerBase(QRunnable):
+    """Base class for all thread pool workers"""
     def __init__(self):
         super().__init__()
+        self.signals = WorkerSignals()
         self._is_cancelled = False
 
     def cancel(self):
         self._is_cancelled = True
 
-class FontLoadingThread(ThreadBase):
-    """Thread for loading system fonts"""
-    finished = Signal(list)
-
     def run(self):
         try:
+            self.work()
+        finally:
+            # Sent last, so owners can let go of the worker once it has reported
+            self.signals.done.emit(self)
+
+    def work(self):
+        raise NotImplementedError
+
+class FontLoadingWorker(WorkerBase):
+    """Worker for refreshing the system fonts behind the on-disk cache"""
+    def __init__(self, cached: Optional[Tuple[str, List[str]]] = None):
+        super().__init__()
+        self.cached = cached
+
+    def work(self):
+        cached_signature, cached_fonts = self.cached or (None, None)
+        try:
+            signature = _font_dirs_signature()
+            if signature == cached_signature:
+                return
+
+            # The GUI thread drops any folder fonts registered meanwhile
+            # before the list is cached or shown
             fonts = QFontDatabase.families()
             if not self._is_cancelled:
-                self.finished.emit(fonts)
+                self.signals.families_refreshed.emit(signature, fonts)
         except Exception as e:
             logger.error(f"Error loading fonts: {e}")
-            self.finished.emit([])
+            if cached_fonts is None:
+                self.signals.finished.emit([])
 
-class FontFolderLoadingThread(ThreadBase):
-    """Thread for loading fonts from a specified folder"""
-    finished = Signal(list)
-    error = Signal(str)
-    
+class FontFolderScanWorker(WorkerBase):
+    """Worker for finding the font files in a specified folder"""
     def __init__(self, folder_path: str):
         super().__init__()
         self.folder_path = folder_path
     
-    def run(self):
+    def work(self):
         try:
-            loaded_fonts = []
-            font_path = Path(self.folder_path)
-            
-            if not font_path.exists():
-                self.error.emit("Specified folder does not exist")
+            if not os.path.isdir(self.folder_path):
+                self.signals.error.emit("Specified folder does not exist")
                 return
 
-            for file in font_path.glob("*.[tToOfF][tToOfF][fFnN]"):
-                if self._is_cancelled:
-                    break
-                    
-                font_id = QFontDatabase.addApplicationFont(str(file))
-                if font_id != -1:
-                    families = QFontDatabase.applicationFontFamilies(font_id)
-                    loaded_fonts.extend(families)
-                else:
-                    logger.warning(f"Failed to load font: {file}")
-            
-            self.finished.emit(loaded_fonts)
+            paths = []
+            with os.scandir(self.folder_path) as entries:
+                for entry in entries:
+                    if self._is_cancelled:
+                        return
+                    _, dot, extension = entry.name.rpartition(".")
+                    if not dot or extension.lower() not in FONT_EXTENSIONS:
+                        continue
+                    if entry.is_file():
+                        paths.append(entry.path)
+
+            self.signals.finished.emit(paths)
         except Exception as e:
             logger.error(f"Error loading fonts from folder: {e}")
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
-class PreviewUpdateThread(ThreadBase):
-    """Thread for updating font previews"""
-    font_processed = Signal(str, str, int)
-    finished = Signal()
-
-    def __init__(self, fonts: List[str], preview_text: str, chunk_size: int = 10):
+class FontFileReadWorker(WorkerBase):
+    """Worker for reading the contents of a batch of font files"""
+    def __init__(self, paths: List[str]):
+        super().__init__()
+        self.paths = paths
+
+    def work(self):
+        font_data = []
+        for path in self.paths:
+            # Read straight into a QByteArray, which Qt keeps by reference,
+            # rather than copying a Python bytes object into one later
+            font_file = QFile(path)
+            if font_file.open(QIODevice.OpenModeFlag.ReadOnly):
+                font_data.append((path, font_file.readAll()))
+                font_file.close()
+            else:
+                logger.warning(f"Failed to read font {path}: {font_file.errorString()}")
+                font_data.append((path, None))
+        self.signals.font_data_ready.emit(font_data)
+
+def _shape_text(text: str, font: QFont) -> QTextLayout:
+    """Shape text into a single unwrapped line"""
+    layout = QTextLayout(text, font)
+    text_option = QTextOption()
+    text_option.setWrapMode(QTextOption.WrapMode.NoWrap)
+    layout.setTextOption(text_option)
+
+    layout.beginLayout()
+    line = layout.createLine()
+    if line.isValid():
+        line.setNumColumns(len(text))
+    layout.endLayout()
+    return layout
+
+def _required_chars(text: str) -> str:
+    """Get the non-ASCII characters a font needs to render the text"""
+    return "".join(sorted({
+        char for char in text if ord(char) > 0x7F and not char.isspace()
+    }))
+
+class FontSupportFilterWorker(WorkerBase):
+    """Worker for dropping fonts that cannot render the preview text"""
+    def __init__(self, fonts: Sequence[str], chars: str, known: Dict[str, bool]):
         super().__init__()
         self.fonts = fonts
-        self.preview_text = preview_text
-        self.chunk_size = chunk_size
+        self.chars = chars
+        self.known = known
 
-    def run(self):
+    def work(self):
+        supported = []
+        checked: Dict[str, bool] = {}
         try:
-            for i in range(0, len(self.fonts), self.chunk_size):
+            for family in self.fonts:
                 if self._is_cancelled:
-                    break
-                
-                chunk = self.fonts[i:i + self.chunk_size]
-                for font_name in chunk:
-                    if self._is_cancelled:
-                        break
-                    self.font_processed.emit(font_name, self.preview_text, i)
-                
-                self.msleep(10)  # Prevent GUI freezing
-            
-            self.finished.emit()
+                    break  # Still report the checks made so far for the cache
+
+                is_supported = self.known.get(family)
+                if is_supported is None:
+                    is_supported = checked.get(family)
+                if is_supported is None:
+                    raw_font = QRawFont.fromFont(QFont(family))
+                    is_supported = raw_font.isValid() and all(
+                        raw_font.supportsCharacter(ord(char)) for char in self.chars
+                    )
+                    checked[family] = is_supported
+                if is_supported:
+                    supported.append(family)
         except Exception as e:
-            logger.error(f"Error updating previews: {e}")
-            self.finished.emit()
+            logger.error(f"Error checking font support: {e}")
+            supported = list(self.fonts)
+        # New results go back to the GUI thread, which owns the cache
+        self.signals.fonts_checked.emit(supported, checked)
+
+class PreviewRenderWorker(WorkerBase):
+    """Worker for rasterizing a preview text off the GUI thread"""
+    def __init__(self, key: tuple):
+        super().__init__()
+        self.key = key
+
+    def work(self):
+        if self._is_cancelled:
+            return  # The preview settings changed while this was queued
 
-class FontPreviewContainer(QFrame):
-    """Custom widget for displaying font previews"""
-    def __init__(self, font_name: str, preview_text: str, font_size: int, parent=None):
+        _, family, size, text, ratio, rgba = self.key
+        image = QImage()
+        box = QRectF()
+        try:
+            layout = _shape_text(text, QFont(family, size))
+            if layout.lineCount():
+                line = layout.lineAt(0)
+                box = QRectF(0, 0, line.naturalTextWidth(), line.height())
+
+                # Italic, script and swash glyphs can overhang their advances,
+                # so the image covers the ink as well as the advance box
+                ink = QRectF(box)
+                for run in line.glyphRuns():
+                    raw_font = run.rawFont()
+                    for glyph, position in zip(run.glyphIndexes(), run.positions()):
+                        ink = ink.united(raw_font.boundingRect(glyph).translated(position))
+                bounds = ink.toAlignedRect()
+
+                image = QImage(
+                    max(1, math.ceil(bounds.width() * ratio)),
+                    max(1, math.ceil(bounds.height() * ratio)),
+                    QImage.Format.Format_ARGB32_Premultiplied
+                )
+                image.setDevicePixelRatio(ratio)
+                image.fill(Qt.GlobalColor.transparent)
+
+                painter = QPainter(image)
+                painter.setPen(QColor.fromRgba(rgba))
+                layout.draw(painter, QPointF(-bounds.left(), -bounds.top()))
+                painter.end()
+
+                # Where the advance box sits inside the image
+                box.translate(-bounds.left(), -bounds.top())
+        except Exception as e:
+            logger.error(f"Error rendering preview for {family}: {e}")
+        self.signals.preview_rendered.emit(self.key, image, box)
+
+class FontListModel(QAbstractListModel):
+    """List model holding the font families shown in the preview list"""
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui(font_name, preview_text, font_size)
-        
-    def setup_ui(self, font_name: str, preview_text: str, font_size: int):
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            FontPreviewContainer {
-                padding: 5px;
-                border-radius: 3px;
-                border: none;
-            }
-            FontPreviewContainer:hover {
-                background-color: #505050;
-            }
-            FontPreviewContainer[selected="true"] {
-                background-color: #cce8ff;
-                border: 1px solid #fff;
-            }
-        """)
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(2)
-        layout.setContentsMargins(5, 5, 5, 5)
-
-        # Font name label
-        self.name_label = QLabel(font_name)
-        self.name_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        layout.addWidget(self.name_label)
-
-        # Preview label
-        self.preview_label = QLabel(preview_text)
-        font = QFont(font_name, font_size)
-        self.preview_label.setFont(font)
-        
-        # Handle RTL text
-        if any(ord(char) in range(0x0600, 0x06FF) for char in preview_text):
-            self.preview_label.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
-        
-        layout.addWidget(self.preview_label)
+        self.fonts: Sequence[str] = ()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.fonts)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.fonts[index.row()]
+        return None
+
+    def set_fonts(self, fonts: Sequence[str]):
+        """Replace the font families shown in the list"""
+        self.beginResetModel()
+        self.fonts = fonts
+        self.endResetModel()
+
+    def refresh_row(self, row: int):
+        """Notify views that a single row needs to be repainted"""
+        if 0 <= row < len(self.fonts):
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def refresh(self):
+        """Notify views that every row needs to be repainted"""
+        if self.fonts:
+            self.dataChanged.emit(self.index(0), self.index(len(self.fonts) - 1))
+
+class FontPreviewDelegate(QStyledItemDelegate):
+    """Item delegate that paints a font name and its preview text"""
+    preview_ready = Signal(int)
+
+    PADDING = 10
+    NAME_HEIGHT = 20
+    HOVER_COLOR = QColor("#505050")
+    SELECTED_COLOR = QColor("#cce8ff")
+    IMAGE_CACHE_SIZE = 512
+    # A little room for fonts taller than the default; taller previews
+    # overflow into the row padding and are clipped at the row edges
+    LINE_HEADROOM = 1.2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.preview_text = ""
+        self.is_rtl = False
+        self.font_size = FontPreviewConfig.default_size
+        self.name_font = QFont()
+        self.name_font.setPixelSize(12)
+        self.name_font.setBold(True)
+        self._row_height_cache: Dict[int, int] = {}
+
+        # Previews are rasterized on the thread pool and kept in an LRU;
+        # the generation discards renders started before a cache clear
+        self._image_cache: OrderedDict = OrderedDict()
+        self._pending_rows: Dict[tuple, set] = {}
+        self._pending_workers: Dict[tuple, PreviewRenderWorker] = {}
+        self._generation = 0
+
+    def clear_font_cache(self):
+        """Drop cached previews, e.g. after new fonts were registered"""
+        self._image_cache.clear()
+        self._generation += 1
+        self.discard_stale_renders()
+
+    def is_current(self, key: tuple) -> bool:
+        """Check whether a preview key matches the current preview settings"""
+        generation, _, size, text, _, _ = key
+        return (
+            generation == self._generation
+            and size == self.font_size
+            and text == self.preview_text
+        )
+
+    def discard_stale_renders(self):
+        """Drop queued or running renders for outdated preview settings"""
+        thread_pool = QThreadPool.globalInstance()
+        for key in [key for key in self._pending_rows if not self.is_current(key)]:
+            del self._pending_rows[key]
+            worker = self._pending_workers.pop(key)
+            try:
+                if thread_pool.tryTake(worker):
+                    continue
+            except RuntimeError:
+                continue  # Already finished; its result will be dropped
+            worker.cancel()
+
+    def preview_image(self, key: tuple, row: int) -> Optional[Tuple[QImage, QRectF]]:
+        """Get a cached preview image and its advance box, rendering it in the background if needed"""
+        preview = self._image_cache.get(key)
+        if preview is not None:
+            self._image_cache.move_to_end(key)
+            return preview
+
+        rows = self._pending_rows.get(key)
+        if rows is None:
+            self._pending_rows[key] = {row}
+            worker = PreviewRenderWorker(key)
+            worker.signals.preview_rendered.connect(self.on_preview_rendered)
+            self._pending_workers[key] = worker
+            QThreadPool.globalInstance().start(worker)
+        else:
+            rows.add(row)
+        return None
+
+    def on_preview_rendered(self, key: tuple, image: QImage, box: QRectF):
+        """Store a rendered preview and ask for its rows to be repainted"""
+        self._pending_workers.pop(key, None)
+        rows = self._pending_rows.pop(key, None)
+        if rows is None or not self.is_current(key):
+            return  # Nobody is waiting for this preview any more
+
+        self._image_cache[key] = (image, box)
+        if len(self._image_cache) > self.IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+        for row in rows:
+            self.preview_ready.emit(row)
+
+    def paint(self, painter, option, index: QModelIndex):
+        font_name = index.data()
+        rect = option.rect
+
+        painter.save()
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, self.SELECTED_COLOR)
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(rect, self.HOVER_COLOR)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+
+        content = rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        name_rect = content.adjusted(0, 0, 0, self.NAME_HEIGHT - content.height())
+        painter.setFont(self.name_font)
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, font_name)
+
+        preview_rect = content.adjusted(0, self.NAME_HEIGHT, 0, 0)
+        key = (
+            self._generation, font_name, self.font_size, self.preview_text,
+            painter.device().devicePixelRatioF(), painter.pen().color().rgba()
+        )
+        preview = self.preview_image(key, index.row())
+        if preview is not None and not preview[0].isNull():
+            image, box = preview
+            # Align by the advance box; any overhanging ink may spill into the padding
+            x = preview_rect.left()
+            if self.is_rtl:
+                x = preview_rect.right() - box.width()
+            y = preview_rect.top() + (preview_rect.height() - box.height()) / 2
+            painter.setClipRect(rect)
+            painter.drawImage(QPointF(x - box.left(), y - box.top()), image)
+        painter.restore()
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        # Every row shares one height so the view never measures each font;
+        # the preview area is sized with headroom for fonts taller than the default
+        height = self._row_height_cache.get(self.font_size)
+        if height is None:
+            font = QFont()
+            font.setPointSize(self.font_size)
+            metrics = QFontMetrics(font)
+            preview_height = math.ceil(metrics.height() * self.LINE_HEADROOM)
+            height = self.NAME_HEIGHT + preview_height + 2 * self.PADDING
+            self._row_height_cache[self.font_size] = height
+        return QSize(0, height)
 
 class FontPreviewer(QMainWindow):
     """Main application window"""
     def __init__(self, config: FontPreviewConfig = FontPreviewConfig()):
         super().__init__()
         self.config = config
+        self.thread_pool = QThreadPool.globalInstance()
+        # The pool deletes finished workers, and their queued results with
+        # them, so running workers are kept here until they are done
+        self._workers: set = set()
+        self._context_menu = None
+        self._support_filter: Optional[FontSupportFilterWorker] = None
+        # Whether a family can render a set of characters, keyed by the
+        # characters; the generation drops checks made before a folder load
+        self._support_cache: Dict[str, Dict[str, bool]] = {}
+        self._support_generation = 0
+        # Once a folder's fonts replace the list, system refreshes are ignored
+        self._folder_fonts_loaded = False
         self.setup_ui()
         self.load_system_fonts()
 
@@ -189,7 +504,7 @@ class FontPreviewer(QMainWindow):
         self.main_layout = QVBoxLayout(main_widget)
         
         self.setup_control_panel()
-        self.setup_scroll_area()
+        self.setup_list_view()
         self.setup_status_area()
 
     def setup_control_panel(self):
@@ -212,6 +527,20 @@ class FontPreviewer(QMainWindow):
         self.size_input.setFixedWidth(120)
         control_layout.addWidget(self.size_input)
 
+        # Hide fonts that would fall back to another font for the text
+        self.unsupported_checkbox = QCheckBox("Hide unsupported fonts")
+        self.unsupported_checkbox.setChecked(self.config.hide_unsupported_fonts)
+        self.unsupported_checkbox.toggled.connect(self.start_update_previews)
+        control_layout.addWidget(self.unsupported_checkbox)
+
+        # Collapse bursts of edits into a single refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.config.refresh_delay_ms)
+        self._refresh_timer.timeout.connect(self.refresh_previews)
+        self.text_input.textChanged.connect(self.schedule_refresh)
+        self.size_input.valueChanged.connect(self.schedule_refresh)
+
         # Search functionality
         self.setup_search_widgets(control_layout)
 
@@ -220,22 +549,32 @@ class FontPreviewer(QMainWindow):
         load_button.clicked.connect(self.load_fonts_from_folder)
         self.main_layout.addWidget(load_button)
 
-    def setup_scroll_area(self):
-        """Set up the scrollable area for font previews"""
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_area.setWidget(self.scroll_content)
-        self.main_layout.addWidget(self.scroll_area)
+    def setup_list_view(self):
+        """Set up the list view that displays font previews"""
+        self.font_model = FontListModel(self)
+        self.preview_delegate = FontPreviewDelegate(self)
+        self.preview_delegate.preview_ready.connect(self.font_model.refresh_row)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.font_model)
+        self.list_view.setItemDelegate(self.preview_delegate)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(5)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setBatchSize(50)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.list_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.list_view.customContextMenuRequested.connect(self.show_context_menu)
+        self.main_layout.addWidget(self.list_view)
 
         # Enable smooth scrolling
         QScroller.grabGesture(
-            self.scroll_area.viewport(),
+            self.list_view.viewport(),
             QScroller.ScrollerGestureType.TouchGesture
         )
         QScroller.grabGesture(
-            self.scroll_area.viewport(),
+            self.list_view.viewport(),
             QScroller.ScrollerGestureType.LeftMouseButtonGesture
         )
 
@@ -268,17 +607,47 @@ class FontPreviewer(QMainWindow):
         parent_layout.addWidget(self.search_input)
 
     def load_system_fonts(self):
-        """Start loading system fonts"""
-        self.load_fonts_thread = FontLoadingThread()
-        self.load_fonts_thread.finished.connect(self.on_fonts_loaded)
-        self.load_fonts_thread.start()
+        """Show the cached system fonts and refresh them in the background"""
+        cached = _load_cached_families()
+        if cached is not None:
+            self.on_fonts_loaded(cached[1])
+
+        worker = FontLoadingWorker(cached)
+        worker.signals.families_refreshed.connect(
+            partial(self.on_system_fonts_refreshed, cached[1] if cached else None)
+        )
+        worker.signals.finished.connect(self.on_fonts_loaded)
+        self.start_worker(worker)
+
+    def start_worker(self, worker: WorkerBase):
+        """Run a worker on the thread pool, keeping it alive until it is done"""
+        self._workers.add(worker)
+        worker.signals.done.connect(self._workers.discard)
+        self.thread_pool.start(worker)
+
+    def on_system_fonts_refreshed(self, cached_fonts: Optional[List[str]],
+                                  signature: str, fonts: List[str]):
+        """Cache the refreshed system fonts and show them if they changed"""
+        if self._folder_fonts_loaded:
+            # families() may list the folder's fonts too, and they cannot be
+            # told apart from system families of the same name
+            return
+        _save_cached_families(signature, fonts)
+
+        # The cached list is already on screen, so only show changes
+        if fonts != cached_fonts:
+            self.on_fonts_loaded(fonts)
 
     def on_fonts_loaded(self, fonts: List[str]):
         """Handle completion of font loading"""
-        self.fonts = fonts
-        self.all_fonts = fonts.copy()
+        if self._folder_fonts_loaded:
+            return  # A folder's fonts have replaced the system list
+        self.set_all_fonts(fonts)
         self.loading_label.hide()
-        self.start_update_previews()
+        if self.search_input.isHidden():
+            self.start_update_previews()
+        else:
+            self.filter_fonts()  # Keep the search the user already applied
 
     def load_fonts_from_folder(self):
         """Handle loading fonts from a selected folder"""
@@ -289,100 +658,155 @@ class FontPreviewer(QMainWindow):
         self.loading_label.setText("Loading fonts from folder...")
         self.loading_label.show()
         
-        self.folder_loading_thread = FontFolderLoadingThread(folder)
-        self.folder_loading_thread.finished.connect(self.on_folder_fonts_loaded)
-        self.folder_loading_thread.error.connect(self.show_error_message)
-        self.folder_loading_thread.start()
+        worker = FontFolderScanWorker(folder)
+        worker.signals.finished.connect(self.on_folder_scanned)
+        worker.signals.error.connect(self.show_error_message)
+        self.start_worker(worker)
+
+    def on_folder_scanned(self, paths: List[str]):
+        """Read the font files found in a folder in batches on the pool"""
+        self._folder_font_paths = paths
+        self._folder_font_data: Dict[str, Optional[QByteArray]] = {}
+        if not paths:
+            self.on_folder_font_data_ready([])
+            return
+
+        batch_size = self.config.read_batch_size
+        for i in range(0, len(paths), batch_size):
+            worker = FontFileReadWorker(paths[i:i + batch_size])
+            worker.signals.font_data_ready.connect(
+                partial(self.on_font_files_read, paths)
+            )
+            self.start_worker(worker)
+
+    def on_font_files_read(self, paths: List[str], font_data: List[Tuple[str, Optional[QByteArray]]]):
+        """Collect a batch of font files read by a pool worker"""
+        if paths is not self._folder_font_paths:
+            return  # Superseded by a newer folder load
+
+        self._folder_font_data.update(font_data)
+        if len(self._folder_font_data) < len(paths):
+            return
+
+        # Register in directory order once every file has been read
+        self.on_folder_font_data_ready([
+            (font_path, self._folder_font_data[font_path]) for font_path in paths
+            if self._folder_font_data[font_path] is not None
+        ])
+
+    def on_folder_font_data_ready(self, font_data: List[Tuple[str, QByteArray]]):
+        """Register the font files read from a folder on the GUI thread"""
+        loaded_fonts = []
+        for path, data in font_data:
+            try:
+                font_id = QFontDatabase.addApplicationFontFromData(data)
+            except Exception as e:
+                logger.warning(f"Failed to load font {path}: {e}")
+                continue
+
+            if font_id != -1:
+                loaded_fonts.extend(QFontDatabase.applicationFontFamilies(font_id))
+            else:
+                logger.warning(f"Failed to load font: {path}")
+
+        self.on_folder_fonts_loaded(loaded_fonts)
 
     def on_folder_fonts_loaded(self, new_fonts: List[str]):
         """Handle completion of folder font loading"""
-        self.fonts = new_fonts
-        self.all_fonts = new_fonts.copy()
+        self.preview_delegate.clear_font_cache()
+        self._support_cache.clear()
+        self._support_generation += 1
+        self._folder_fonts_loaded = True
+        self.set_all_fonts(new_fonts)
         self.loading_label.hide()
         self.start_update_previews()
 
+    def set_all_fonts(self, fonts: List[str]):
+        """Replace the full font list and show it unfiltered"""
+        # The full list is immutable, so the unfiltered view can share it
+        self.all_fonts: Tuple[str, ...] = tuple(fonts)
+        self._fonts_folded = [font.casefold() for font in self.all_fonts]
+        self.fonts: Sequence[str] = self.all_fonts
+
     def start_update_previews(self):
-        """Begin updating font previews"""
+        """Show the current font list with the current preview settings"""
+        self.update_preview_settings()
+        if self._support_filter is not None:
+            self._support_filter.cancel()
+            self._support_filter = None
+
+        chars = _required_chars(self.preview_delegate.preview_text)
+        if not chars or not self.unsupported_checkbox.isChecked():
+            self.font_model.set_fonts(self.fonts)
+            return
+
+        known = dict(self._support_cache.get(chars, {}))
+        self._support_filter = FontSupportFilterWorker(self.fonts, chars, known)
+        self._support_filter.signals.fonts_checked.connect(partial(
+            self.on_supported_fonts_found,
+            self._support_filter, chars, self._support_generation
+        ))
+        # Superseded filters stay alive until they report, so their checks are cached
+        self.start_worker(self._support_filter)
+
+    def on_supported_fonts_found(self, worker: FontSupportFilterWorker, chars: str,
+                                 generation: int, fonts: List[str],
+                                 checked: Dict[str, bool]):
+        """Show the fonts that can render the preview text"""
+        if generation != self._support_generation:
+            return  # Checked against the font database before a folder load
+        self._support_cache.setdefault(chars, {}).update(checked)
+
+        if worker is not self._support_filter:
+            return  # Superseded by a newer update
+        self._support_filter = None
+        self.font_model.set_fonts(fonts)
+
+    def schedule_refresh(self):
+        """Refresh the previews once the input has settled"""
+        self._refresh_timer.start()
+
+    def refresh_previews(self):
+        """Repaint the font previews after the preview text or size changed"""
+        size_changed = self.preview_delegate.font_size != self.size_input.value()
+        chars = _required_chars(self.preview_delegate.preview_text)
+        self.update_preview_settings()
+        chars_changed = _required_chars(self.preview_delegate.preview_text) != chars
+        if chars_changed and self.unsupported_checkbox.isChecked():
+            # Different characters may be supported by different fonts
+            self.start_update_previews()
+            return
+        if size_changed:
+            self.preview_delegate.sizeHintChanged.emit(QModelIndex())
+        self.font_model.refresh()
+
+    def update_preview_settings(self):
+        """Pass the current preview text and size to the delegate"""
         preview_text = self.text_input.text() or self.config.default_text
-        self.clear_previews()
-        
-        self.setup_progress_dialog()
-        
-        self.update_thread = PreviewUpdateThread(
-            self.fonts,
-            preview_text,
-            self.config.chunk_size
-        )
-        self.update_thread.font_processed.connect(self.add_font_preview)
-        self.update_thread.finished.connect(self.update_finished)
-        self.update_thread.start()
-
-    def setup_progress_dialog(self):
-        """Set up the progress dialog for preview updates"""
-        self.progress_dialog = QProgressDialog(
-            "Updating previews...", 
-            "Cancel", 
-            0, 
-            len(self.fonts), 
-            self
-        )
-        self.progress_dialog.setWindowTitle("Updating Previews")
-        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        self.progress_dialog.setMinimumDuration(0)
-        self.progress_dialog.canceled.connect(self.cancel_update)
-
-    def clear_previews(self):
-        """Clear existing font previews"""
-        while self.scroll_layout.count():
-            child = self.scroll_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-    def add_font_preview(self, font_name: str, preview_text: str, progress: int):
-        """Add a new font preview to the scroll area"""
-        if self.progress_dialog:
-            self.progress_dialog.setValue(progress)
-
-        container = FontPreviewContainer(
-            font_name,
-            preview_text,
-            self.size_input.value(),
-            self
-        )
-        self.add_context_menu(container, font_name)
-        
-        self.scroll_layout.addWidget(container)
-        
-        # Add spacing
-        spacer = QLabel()
-        spacer.setFixedHeight(10)
-        self.scroll_layout.addWidget(spacer)
-
-    def add_context_menu(self, widget: QWidget, font_name: str):
-        """Add context menu to a widget"""
-        def show_context_menu(point):
-            context_menu = QMenu(self)
-            copy_action = QAction("Copy Font Name", self)
-            copy_action.triggered.connect(
-                lambda: QApplication.clipboard().setText(font_name)
-            )
-            context_menu.addAction(copy_action)
-            context_menu.exec(widget.mapToGlobal(point))
+        self.preview_delegate.preview_text = preview_text
+        self.preview_delegate.is_rtl = _RTL_RE.search(preview_text) is not None
+        self.preview_delegate.font_size = self.size_input.value()
+        self.preview_delegate.discard_stale_renders()
+
+    def show_context_menu(self, point):
+        """Show the context menu for the font preview under the cursor"""
+        index = self.list_view.indexAt(point)
+        if not index.isValid():
+            return
 
-        widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        widget.customContextMenuRequested.connect(show_context_menu)
+        # One menu is built on first use and shared by every row
+        if self._context_menu is None:
+            self._context_menu = QMenu(self)
+            self._copy_action = QAction("Copy Font Name", self)
+            self._copy_action.triggered.connect(self.copy_font_name)
+            self._context_menu.addAction(self._copy_action)
 
-    def cancel_update(self):
-        """Cancel the current preview update operation"""
-        if self.update_thread:
-            self.update_thread.cancel()
+        self._copy_action.setData(index.data())
+        self._context_menu.exec(self.list_view.viewport().mapToGlobal(point))
 
-    def update_finished(self):
-        """Handle completion of preview updates"""
-        if self.progress_dialog:
-            self.progress_dialog.close()
-        self.update_thread = None
-        self.progress_dialog = None
+    def copy_font_name(self):
+        """Copy the font name the context menu was opened on"""
+        QApplication.clipboard().setText(self._copy_action.data())
 
     def toggle_search(self):
         """Toggle search functionality"""
@@ -402,19 +826,19 @@ class FontPreviewer(QMainWindow):
             except Exception as e:
                 logger.warning(f"Failed to load search icon: {e}")
                 self.search_button.setText("🔍")
-            self.fonts = self.all_fonts.copy()
+            self.fonts = self.all_fonts
             self.start_update_previews()
 
     def filter_fonts(self):
         """Filter fonts based on search text"""
-        search_text = self.search_input.text().lower()
+        search_text = self.search_input.text().casefold()
         if search_text:
             self.fonts = [
-                font for font in self.all_fonts 
-                if search_text in font.lower()
+                font for font, folded in zip(self.all_fonts, self._fonts_folded)
+                if search_text in folded
             ]
         else:
-            self.fonts = self.all_fonts.copy()
+            self.fonts = self.all_fonts
         self.start_update_previews()
 
     def show_error_message(self, message: str):